@@ -34,6 +34,9 @@ CREATE TABLE files (
     last_modified TIMESTAMP,
     is_processed BOOLEAN DEFAULT FALSE,
     file_metadata JSON,  -- Cambiado de metadata a file_metadata
+    device BIGINT,
+    inode BIGINT,
+    mtime_ns BIGINT,
     FOREIGN KEY (user_id) REFERENCES users(id)
 );
 
@@ -210,6 +213,24 @@ CREATE INDEX idx_file_relationships ON file_relationships(source_file_id, relati
 CREATE INDEX idx_analysis_language ON analysis_results(language);
 CREATE INDEX idx_analysis_content_hash ON analysis_results(content_hash);
 
+-- Índices sobre claves foráneas consultadas con frecuencia
+CREATE INDEX idx_files_user ON files(user_id);
+CREATE INDEX idx_files_fingerprint ON files(user_id, inode, device, mtime_ns, file_size);
+CREATE INDEX idx_file_categories_category ON file_categories(category_id);
+CREATE INDEX idx_queue_file ON processing_queue(file_id);
+CREATE INDEX idx_queue_status_priority ON processing_queue(status, priority);
+CREATE INDEX idx_analysis_file_type ON analysis_results(file_id, analysis_type);
+CREATE INDEX idx_history_file ON processing_history(file_id);
+
+-- Columnas generadas sobre claves JSON consultadas con frecuencia, para
+-- que los filtros por JSON_EXTRACT puedan usar un índice. Los procesadores
+-- de Word, PDF y Excel guardan el autor en la clave "author" (NULL si no hay);
+-- models.py crea la misma columna al usar create_all sobre MySQL
+ALTER TABLE files
+    ADD COLUMN metadata_author VARCHAR(255)
+        AS (JSON_UNQUOTE(JSON_EXTRACT(file_metadata, '$.author'))) VIRTUAL,
+    ADD INDEX idx_files_metadata_author (metadata_author);
+
 -- Modificar tabla files para remover campos de almacenamiento físico
 ALTER TABLE files
     DROP COLUMN IF EXISTS file_path,